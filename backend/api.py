@@ -7,7 +7,7 @@ from fastapi import FastAPI, HTTPException, Depends, status, File, UploadFile
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, field_validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 import jwt
@@ -100,12 +100,24 @@ class AccidentCreate(BaseModel):
     weather_info: Optional[str] = None
     notes: Optional[str] = None
 
+    # The dashboard filters on case-sensitive lowercase literals, so
+    # normalize client-supplied casing at the write boundary
+    @field_validator("severity")
+    @classmethod
+    def _lowercase(cls, value):
+        return value.lower()
+
 
 class AccidentUpdate(BaseModel):
     status: Optional[str] = None
     severity: Optional[str] = None
     notes: Optional[str] = None
 
+    @field_validator("status", "severity")
+    @classmethod
+    def _lowercase(cls, value):
+        return value.lower() if value else value
+
 
 class AlertCreate(BaseModel):
     accident_id: int
@@ -217,8 +229,9 @@ async def register(user_data: UserCreate):
             detail="Username or email already exists"
         )
     
-    # Create user
-    password_hash = bcrypt.hash(user_data.password)
+    # Create user (cost 10 - OWASP-acceptable and ~4x faster to verify
+    # than the library default 12)
+    password_hash = bcrypt.using(rounds=10).hash(user_data.password)
     
     user = await db.user.create(
         data={
@@ -414,24 +427,28 @@ async def delete_accident(
 @app.get("/api/analytics/stats", tags=["Analytics"])
 async def get_statistics(current_user = Depends(get_current_user)):
     """Get overall statistics"""
-    total_accidents = await db.accident.count()
-    total_alerts = await db.alert.count()
-    
-    pending_accidents = await db.accident.count(where={"status": "pending"})
-    confirmed_accidents = await db.accident.count(where={"status": "confirmed"})
-    
-    # Severity breakdown
-    severity_stats = {}
-    for severity in ["low", "medium", "high", "critical"]:
-        count = await db.accident.count(where={"severity": severity})
-        severity_stats[severity] = count
-    
-    # Recent accidents (last 24 hours)
+    severities = ["low", "medium", "high", "critical"]
     yesterday = datetime.now() - timedelta(days=1)
-    recent_accidents = await db.accident.count(
-        where={"timestamp": {"gte": yesterday}}
+
+    # Run all nine counts concurrently - wall time becomes one round trip
+    # instead of the sum of nine sequential awaits
+    (
+        total_accidents,
+        total_alerts,
+        pending_accidents,
+        confirmed_accidents,
+        recent_accidents,
+        *severity_counts,
+    ) = await asyncio.gather(
+        db.accident.count(),
+        db.alert.count(),
+        db.accident.count(where={"status": "pending"}),
+        db.accident.count(where={"status": "confirmed"}),
+        db.accident.count(where={"timestamp": {"gte": yesterday}}),
+        *(db.accident.count(where={"severity": severity}) for severity in severities),
     )
-    
+    severity_stats = dict(zip(severities, severity_counts))
+
     return {
         "total_accidents": total_accidents,
         "total_alerts": total_alerts,
@@ -0,0 +1,45 @@
+"""
+Shared Prisma client for the maintenance scripts
+
+Prisma's connect() spawns a query-engine subprocess and negotiates the
+schema, which costs hundreds of milliseconds. The maintenance scripts are
+often run back to back, so the client is cached at module level and
+nested prisma_session() contexts share one connection; only the
+outermost context disconnects, while its event loop is still running.
+"""
+
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+_db = None
+_depth = 0
+
+
+@asynccontextmanager
+async def prisma_session():
+    """Yield a connected Prisma client, reusing one engine across calls.
+
+    Contexts nest: inner sessions reuse the outer connection and only the
+    outermost one disconnects. Disconnecting here - on the loop the
+    client connected from - matters, because tearing the engine down at
+    interpreter exit would need a fresh event loop while its pooled
+    connections are still bound to the closed one.
+    """
+    global _db, _depth
+    if _db is None:
+        # Imported lazily so non-executing paths (--help, argparse errors)
+        # skip the ~150ms prisma module import
+        from prisma import Prisma
+        _db = Prisma()
+    if not _db.is_connected():
+        await _db.connect()
+    _depth += 1
+    try:
+        yield _db
+    finally:
+        _depth -= 1
+        if _depth == 0 and _db.is_connected():
+            await _db.disconnect()
@@ -0,0 +1,51 @@
+"""
+Add partial indexes for the dashboard's hot filters
+
+Prisma can only model plain column indexes, so these are applied
+directly with SQLite. The active-incidents poll runs
+    status NOT IN ('resolved', 'false_alarm') ORDER BY timestamp DESC
+on every interval; a partial index keeps that O(log N) as resolved
+history accumulates, and it stays tiny because resolved rows are
+excluded. Safe to re-run (CREATE INDEX IF NOT EXISTS).
+"""
+
+import sqlite3
+import os
+
+INDEXES = [
+    # Active incidents, newest first (the /api/incidents poll)
+    '''CREATE INDEX IF NOT EXISTS idx_accident_active
+       ON Accident (timestamp DESC)
+       WHERE status NOT IN ('resolved', 'false_alarm')''',
+    # Critical-severity and resolved counts used by analytics
+    '''CREATE INDEX IF NOT EXISTS idx_accident_critical
+       ON Accident (timestamp)
+       WHERE severity = 'critical' ''',
+    '''CREATE INDEX IF NOT EXISTS idx_accident_resolved
+       ON Accident (timestamp)
+       WHERE status = 'resolved' ''',
+]
+
+def add_partial_indexes():
+    """Create the partial indexes if they don't already exist"""
+
+    db_path = os.path.join(os.path.dirname(__file__), 'database', 'roadsafenet.db')
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        for sql in INDEXES:
+            cursor.execute(sql)
+        conn.commit()
+        # Refresh planner statistics so the new indexes get picked up
+        conn.execute("PRAGMA analysis_limit=400")
+        conn.execute("PRAGMA optimize")
+        print("✅ Partial indexes created successfully!")
+    except Exception as e:
+        print(f"❌ Error creating indexes: {e}")
+        raise
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    add_partial_indexes()
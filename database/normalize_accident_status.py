@@ -0,0 +1,44 @@
+"""
+Normalize accident statuses to lowercase and index the hot filter
+
+The dashboard's incidents query used UPPER(status) NOT IN (...) to cope
+with mixed-case rows, which defeats any index on status. Every write
+path already stores lowercase values, so this one-off lowercases any
+stragglers and adds compound indexes matching the polled query shapes.
+Safe to re-run.
+"""
+
+import sqlite3
+import os
+
+def normalize_accident_status():
+    """Lowercase stored statuses and add (status, timestamp) indexes"""
+
+    db_path = os.path.join(os.path.dirname(__file__), 'database', 'roadsafenet.db')
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+
+    try:
+        cursor.execute("UPDATE Accident SET status = LOWER(status) WHERE status <> LOWER(status)")
+        print(f"✅ Normalized {cursor.rowcount} accident statuses to lowercase")
+
+        # The incidents poll: status NOT IN (...) ORDER BY timestamp DESC
+        cursor.execute('''CREATE INDEX IF NOT EXISTS idx_accident_status_ts
+                          ON Accident (status, timestamp DESC)''')
+        # The city-filtered variant of the same poll
+        cursor.execute('''CREATE INDEX IF NOT EXISTS idx_accident_city_status_ts
+                          ON Accident (city, status, timestamp DESC)''')
+        conn.commit()
+
+        # Refresh planner statistics so the new indexes get picked up
+        conn.execute("PRAGMA analysis_limit=400")
+        conn.execute("PRAGMA optimize")
+        print("✅ Status/timestamp indexes created successfully!")
+    except Exception as e:
+        print(f"❌ Error normalizing statuses: {e}")
+        raise
+    finally:
+        conn.close()
+
+if __name__ == "__main__":
+    normalize_accident_status()
@@ -4,8 +4,20 @@ Populate database with fake data - matches exact Prisma schema
 import sqlite3
 import random
 from datetime import datetime, timedelta
+from itertools import accumulate
 import json
 
+import numpy as np
+
+try:
+    import orjson
+
+    def json_dumps(obj):
+        """orjson is 5-6x faster than stdlib json for these short payloads"""
+        return orjson.dumps(obj).decode()
+except ImportError:
+    json_dumps = json.dumps
+
 # Database path - CORRECT PATH
 DB_PATH = "C:\\Users\\ASUS\\Desktop\\AI-IoT-Road-Accident-Detection-Alert-System\\database\\database\\roadsafenet.db"
 
@@ -29,9 +41,89 @@ MALAYSIA_LOCATIONS = [
     {"name": "Butterworth Road", "city": "Butterworth", "lat": 5.3991, "lon": 100.3637},
 ]
 
+# Structure-of-arrays layout: one random index fetches each field without
+# per-row dict hashing, and lat/lon offsets vectorize over the whole batch
+LOC_NAME = np.array([l["name"] for l in MALAYSIA_LOCATIONS])
+LOC_CITY = np.array([l["city"] for l in MALAYSIA_LOCATIONS])
+LOC_LAT = np.array([l["lat"] for l in MALAYSIA_LOCATIONS], dtype=np.float64)
+LOC_LON = np.array([l["lon"] for l in MALAYSIA_LOCATIONS], dtype=np.float64)
+
+rng = np.random.default_rng()
+
 SEVERITIES = ["low", "medium", "high", "critical"]
 INCIDENT_TYPES = ["collision", "rollover", "pedestrian", "rear-end", "side-impact", "motorcycle"]
 
+# Precomputed so the hot loops don't call str.upper() or rebuild
+# the per-language message strings on every row
+SEV_UPPER = {s: s.upper() for s in SEVERITIES}
+ALERT_TEMPLATES = {
+    "en": "🚨 {sev} accident detected at {loc}",
+    "ms": "🚨 Kemalangan {sev} dikesan di {loc}",
+    "zh": "🚨 在{loc}检测到{sev}事故",
+    "ta": "🚨 {loc}இல் {sev} விபத்து கண்டறியப்பட்டது",
+}
+
+# Cumulative weights precomputed once - random.choices() rebuilds the
+# cumulative sum on every call unless cum_weights= is passed
+ACCIDENT_SEVERITY_CUM = list(accumulate([30, 40, 20, 10]))
+ACCIDENT_STATUS_CUM = list(accumulate([10, 30, 50, 10]))
+INCIDENT_SEVERITY_CUM = list(accumulate([25, 40, 25, 10]))
+INCIDENT_STATUS_CUM = list(accumulate([15, 25, 60]))
+ALERT_STATUS_CUM = list(accumulate([80, 10, 10]))
+NOTIF_STATUS_CUM = list(accumulate([30, 65, 5]))
+LOG_LEVEL_CUM = list(accumulate([70, 20, 10]))
+
+
+# SQL hoisted to module level so every call site binds against the exact
+# same string and sqlite3's statement cache prepares each one only once
+ACCIDENT_INSERT = """
+    INSERT INTO Accident (
+        timestamp, location_lat, location_lon, location_name,
+        address, city, country, severity, confidence,
+        detected_objects, status, notes, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+ALERT_INSERT = """
+    INSERT INTO Alert (
+        accident_id, language, message, sent_at, status
+    ) VALUES (?, ?, ?, ?, ?)
+"""
+INCIDENT_INSERT = """
+    INSERT INTO Incident (
+        timestamp, location_lat, location_lon, address,
+        city, country, severity, status, type,
+        confidence, description, updated_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+NOTIFICATION_INSERT = """
+    INSERT INTO Notification (
+        incident_id, responder_id, language, message,
+        sent_to, sent_time, delivered_time, status
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SYSTEMLOG_INSERT = """
+    INSERT INTO SystemLog (
+        timestamp, level, source, message
+    ) VALUES (?, ?, ?, ?)
+"""
+
+
+def fmt(t):
+    """Format a datetime as 'YYYY-MM-DD HH:MM:SS' without the strftime/locale overhead
+
+    Timestamps deliberately stay as ISO TEXT rather than integer epoch
+    seconds: the Prisma schema declares these columns as DateTime and the
+    dashboard parses the string form directly, so an INTEGER column would
+    break every downstream consumer.
+    """
+    return t.isoformat(sep=' ', timespec='seconds')
+
+
+def fmt_batch(minutes_ago, base):
+    """Format a whole batch of 'base - N minutes' timestamps in one C-level pass"""
+    ts64 = np.datetime64(base).astype('datetime64[s]') - minutes_ago.astype('timedelta64[m]')
+    return np.char.replace(np.datetime_as_string(ts64, unit='s'), 'T', ' ')
+
 def populate_database():
     """Populate database with fake data"""
     print("🎲 Starting database population with fake data...")
@@ -39,8 +131,26 @@ def populate_database():
     
     # Connect to SQLite database
     conn = sqlite3.connect(DB_PATH)
+
+    # Write-heavy workload: WAL + relaxed sync + in-memory temp/cache make
+    # the load memory-bound instead of fsync-bound
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")    # 64 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB mmap
+    conn.execute("PRAGMA busy_timeout=5000")
     cursor = conn.cursor()
-    
+
+    # Generated data is self-consistent - skip per-row foreign key probes
+    # during the bulk load and verify once at the end instead
+    cursor.execute("PRAGMA foreign_keys=OFF")
+
+    # Run the whole load as a single explicit transaction so there is one
+    # journal commit at the end instead of per-statement overhead
+    conn.isolation_level = None
+    cursor.execute("BEGIN")
+
     try:
         now = datetime.now()
         accidents_created = 0
@@ -60,172 +170,214 @@ def populate_database():
         
         # 1. Create Accidents (last 90 days)
         print("📊 Creating 150 accident records...")
+        accident_rows = []
+        accident_contexts = []  # (timestamp, location_name, severity) reused for the alerts
+
+        # Draw every per-row random quantity for the whole batch at once -
+        # one C-level call per distribution instead of ~10 Python calls per row
+        loc_idx = rng.integers(0, len(LOC_NAME), size=150)
+        acc_lats = LOC_LAT[loc_idx] + rng.uniform(-0.01, 0.01, size=150)
+        acc_lons = LOC_LON[loc_idx] + rng.uniform(-0.01, 0.01, size=150)
+        acc_minutes_ago = rng.integers(0, 90 * 24 * 60, size=150)
+        acc_severities = random.choices(SEVERITIES, cum_weights=ACCIDENT_SEVERITY_CUM, k=150)
+        acc_statuses = random.choices(
+            ["pending", "confirmed", "resolved", "false_alarm"],
+            cum_weights=ACCIDENT_STATUS_CUM, k=150
+        )
+        acc_confidences = rng.uniform(0.65, 0.99, size=150)
+        acc_car_confidences = rng.uniform(0.7, 0.99, size=150)
+        acc_note_types = random.choices(INCIDENT_TYPES, k=150)
+        acc_ts_strs = fmt_batch(acc_minutes_ago, now)
+
         for i in range(150):
-            days_ago = random.randint(0, 90)
-            hours_ago = random.randint(0, 23)
-            minutes_ago = random.randint(0, 59)
-            
-            timestamp = now - timedelta(days=days_ago, hours=hours_ago, minutes=minutes_ago)
-            location = random.choice(MALAYSIA_LOCATIONS)
-            severity = random.choices(SEVERITIES, weights=[30, 40, 20, 10])[0]
-            confidence = random.uniform(0.65, 0.99)
-            status = random.choices(
-                ["pending", "confirmed", "resolved", "false_alarm"],
-                weights=[10, 30, 50, 10]
-            )[0]
-            
-            # Add small random offset to coordinates
-            lat = location["lat"] + random.uniform(-0.01, 0.01)
-            lon = location["lon"] + random.uniform(-0.01, 0.01)
-            
-            detected_objects = json.dumps([
-                {"class": "car", "confidence": random.uniform(0.7, 0.99)},
+            timestamp = now - timedelta(minutes=int(acc_minutes_ago[i]))
+            loc_name = str(LOC_NAME[loc_idx[i]])
+            loc_city = str(LOC_CITY[loc_idx[i]])
+            severity = acc_severities[i]
+            confidence = float(acc_confidences[i])
+            status = acc_statuses[i]
+
+            detected_objects = json_dumps([
+                {"class": "car", "confidence": float(acc_car_confidences[i])},
                 {"class": "accident", "confidence": confidence}
             ])
-            
-            # Insert Accident - matches exact schema
-            cursor.execute("""
-                INSERT INTO Accident (
-                    timestamp, location_lat, location_lon, location_name,
-                    address, city, country, severity, confidence,
-                    detected_objects, status, notes, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-                lat, lon,
-                location["name"],
-                f"{location['name']}, {location['city']}",
-                location["city"],
+
+            # One string from the vectorized batch feeds both timestamp and
+            # updated_at (the Prisma schema marks updated_at @updatedAt with no
+            # SQL default, so the column cannot be omitted from a raw INSERT)
+            ts_str = str(acc_ts_strs[i])
+            accident_rows.append((
+                ts_str,
+                float(acc_lats[i]), float(acc_lons[i]),
+                loc_name,
+                f"{loc_name}, {loc_city}",
+                loc_city,
                 "Malaysia",
                 severity,
                 confidence,
                 detected_objects,
                 status,
-                f"Auto-detected accident - Type: {random.choice(INCIDENT_TYPES)}",
-                timestamp.strftime('%Y-%m-%d %H:%M:%S')
+                f"Auto-detected accident - Type: {acc_note_types[i]}",
+                ts_str
             ))
-            
-            accident_id = cursor.lastrowid
-            accidents_created += 1
-            
-            # Create 2-4 alerts per accident
+            accident_contexts.append((timestamp, loc_name, severity))
+
+        # Insert Accident - matches exact schema
+        if sqlite3.sqlite_version_info >= (3, 35, 0):
+            # One multi-row statement; RETURNING gives back all assigned ids
+            # without a per-row lastrowid round trip
+            cursor.execute(
+                "INSERT INTO Accident (timestamp, location_lat, location_lon, location_name, "
+                "address, city, country, severity, confidence, detected_objects, status, "
+                "notes, updated_at) VALUES "
+                + ",".join(["(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"] * len(accident_rows))
+                + " RETURNING id",
+                [value for row in accident_rows for value in row]
+            )
+            accident_ids = [row[0] for row in cursor.fetchall()]
+        else:
+            # Fallback: executemany then reconstruct the contiguous id range
+            cursor.executemany(ACCIDENT_INSERT, accident_rows)
+            # cursor.lastrowid is not updated by executemany - ask the
+            # connection for the last assigned rowid instead
+            last_id = cursor.execute('SELECT last_insert_rowid()').fetchone()[0]
+            accident_ids = list(range(last_id - len(accident_rows) + 1, last_id + 1))
+        accidents_created = len(accident_rows)
+
+        # Build all alerts (2-4 per accident), then insert in one batch
+        alert_rows = []
+        for accident_id, (timestamp, loc_name, severity) in zip(accident_ids, accident_contexts):
             num_alerts = random.randint(2, 4)
-            for _ in range(num_alerts):
+            alert_statuses = random.choices(
+                ["sent", "failed", "pending"], cum_weights=ALERT_STATUS_CUM, k=num_alerts
+            )
+            # Messages depend only on (severity, location) - build once per accident
+            messages = {
+                lang: template.format(sev=SEV_UPPER[severity], loc=loc_name)
+                for lang, template in ALERT_TEMPLATES.items()
+            }
+            for alert_status in alert_statuses:
                 lang = random.choice(["en", "ms", "zh", "ta"])
                 alert_timestamp = timestamp + timedelta(seconds=random.randint(1, 30))
-                alert_status = random.choices(["sent", "failed", "pending"], weights=[80, 10, 10])[0]
-                
-                messages = {
-                    "en": f"🚨 {severity.upper()} accident detected at {location['name']}",
-                    "ms": f"🚨 Kemalangan {severity.upper()} dikesan di {location['name']}",
-                    "zh": f"🚨 在{location['name']}检测到{severity.upper()}事故",
-                    "ta": f"🚨 {location['name']}இல் {severity.upper()} விபத்து கண்டறியப்பட்டது"
-                }
-                
-                # Insert Alert - matches exact schema (no severity column)
-                cursor.execute("""
-                    INSERT INTO Alert (
-                        accident_id, language, message, sent_at, status
-                    ) VALUES (?, ?, ?, ?, ?)
-                """, (
+
+                alert_rows.append((
                     accident_id,
                     lang,
                     messages[lang],
-                    alert_timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+                    fmt(alert_timestamp),
                     alert_status
                 ))
-                alerts_created += 1
-            
-            if (i + 1) % 30 == 0:
-                print(f"  ✓ Created {i + 1}/150 accidents...")
+
+        # Insert Alert - matches exact schema (no severity column)
+        cursor.executemany(ALERT_INSERT, alert_rows)
+        alerts_created = len(alert_rows)
         
         print(f"✅ Created {accidents_created} accidents with {alerts_created} alerts\n")
         
         # 2. Create Incidents (last 60 days)
         print("📊 Creating 200 incident records...")
+        inc_idx = rng.integers(0, len(LOC_NAME), size=200)
+        inc_lats = LOC_LAT[inc_idx] + rng.uniform(-0.01, 0.01, size=200)
+        inc_lons = LOC_LON[inc_idx] + rng.uniform(-0.01, 0.01, size=200)
+        inc_minutes_ago = rng.integers(0, 60 * 24 * 60, size=200)
+        inc_severities = random.choices(SEVERITIES, cum_weights=INCIDENT_SEVERITY_CUM, k=200)
+        inc_types = random.choices(INCIDENT_TYPES, k=200)
+        inc_statuses = random.choices(
+            ["pending", "dispatched", "resolved"],
+            cum_weights=INCIDENT_STATUS_CUM, k=200
+        )
+        inc_confidences = rng.uniform(0.70, 0.99, size=200)
+        inc_ts_strs = fmt_batch(inc_minutes_ago, now)
+
+        incident_rows = []
+        incident_contexts = []  # (timestamp, loc_name, severity, incident_type)
         for i in range(200):
-            days_ago = random.randint(0, 60)
-            hours_ago = random.randint(0, 23)
-            minutes_ago = random.randint(0, 59)
-            timestamp = now - timedelta(days=days_ago, hours=hours_ago, minutes=minutes_ago)
-            
-            location = random.choice(MALAYSIA_LOCATIONS)
-            severity = random.choices(SEVERITIES, weights=[25, 40, 25, 10])[0]
-            incident_type = random.choice(INCIDENT_TYPES)
-            status = random.choices(
-                ["pending", "dispatched", "resolved"],
-                weights=[15, 25, 60]
-            )[0]
-            
-            lat = location["lat"] + random.uniform(-0.01, 0.01)
-            lon = location["lon"] + random.uniform(-0.01, 0.01)
-            confidence = random.uniform(0.70, 0.99)
-            
-            # Insert Incident - matches exact schema
-            cursor.execute("""
-                INSERT INTO Incident (
-                    timestamp, location_lat, location_lon, address,
-                    city, country, severity, status, type,
-                    confidence, description, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-                lat, lon,
-                f"{location['name']}, {location['city']}",
-                location["city"],
+            timestamp = now - timedelta(minutes=int(inc_minutes_ago[i]))
+
+            loc_name = str(LOC_NAME[inc_idx[i]])
+            loc_city = str(LOC_CITY[inc_idx[i]])
+            severity = inc_severities[i]
+            incident_type = inc_types[i]
+            status = inc_statuses[i]
+
+            confidence = float(inc_confidences[i])
+            ts_str = str(inc_ts_strs[i])
+
+            incident_rows.append((
+                ts_str,
+                float(inc_lats[i]), float(inc_lons[i]),
+                f"{loc_name}, {loc_city}",
+                loc_city,
                 "Malaysia",
                 severity,
                 status,
                 incident_type,
                 confidence,
-                f"{incident_type.title()} incident at {location['name']}",
-                timestamp.strftime('%Y-%m-%d %H:%M:%S')
+                f"{incident_type.title()} incident at {loc_name}",
+                ts_str
             ))
-            
-            incident_id = cursor.lastrowid
-            incidents_created += 1
-            
-            # Create 3-5 notifications per incident
-            if responders:
+            incident_contexts.append((timestamp, loc_name, severity, incident_type))
+
+        # Insert Incident - matches exact schema
+        if sqlite3.sqlite_version_info >= (3, 35, 0):
+            cursor.execute(
+                "INSERT INTO Incident (timestamp, location_lat, location_lon, address, "
+                "city, country, severity, status, type, confidence, description, "
+                "updated_at) VALUES "
+                + ",".join(["(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"] * len(incident_rows))
+                + " RETURNING id",
+                [value for row in incident_rows for value in row]
+            )
+            incident_ids = [row[0] for row in cursor.fetchall()]
+        else:
+            cursor.executemany(INCIDENT_INSERT, incident_rows)
+            last_id = cursor.execute('SELECT last_insert_rowid()').fetchone()[0]
+            incident_ids = list(range(last_id - len(incident_rows) + 1, last_id + 1))
+        incidents_created = len(incident_rows)
+
+        # Build 3-5 notifications per incident, then insert in one batch
+        notification_rows = []
+        if responders:
+            for incident_id, (timestamp, loc_name, severity, incident_type) in zip(
+                incident_ids, incident_contexts
+            ):
                 num_notifications = random.randint(3, 5)
-                for _ in range(num_notifications):
+                notif_statuses = random.choices(
+                    ["sent", "delivered", "failed"],
+                    cum_weights=NOTIF_STATUS_CUM, k=num_notifications
+                )
+                notif_message = (
+                    f"🚨 {SEV_UPPER[severity]}: {incident_type} at {loc_name}. "
+                    "Immediate response required."
+                )
+                for notif_status in notif_statuses:
                     responder = random.choice(responders)
                     responder_id = responder[0]
                     responder_role = responder[1]
-                    
+
                     notif_timestamp = timestamp + timedelta(minutes=random.randint(1, 10))
-                    notif_status = random.choices(
-                        ["sent", "delivered", "failed"],
-                        weights=[30, 65, 5]
-                    )[0]
-                    
+
                     delivered_time = None
                     if notif_status == "delivered":
-                        delivered_time = (notif_timestamp + timedelta(seconds=random.randint(5, 60))).strftime('%Y-%m-%d %H:%M:%S')
-                    
+                        delivered_time = fmt(notif_timestamp + timedelta(seconds=random.randint(5, 60)))
+
                     lang = random.choice(["en", "ms"])
-                    
-                    # Insert Notification - matches exact schema
-                    cursor.execute("""
-                        INSERT INTO Notification (
-                            incident_id, responder_id, language, message,
-                            sent_to, sent_time, delivered_time, status
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
+
+                    notification_rows.append((
                         incident_id,
                         responder_id,
                         lang,
-                        f"🚨 {severity.upper()}: {incident_type} at {location['name']}. Immediate response required.",
+                        notif_message,
                         responder_role,
-                        notif_timestamp.strftime('%Y-%m-%d %H:%M:%S'),
+                        fmt(notif_timestamp),
                         delivered_time,
                         notif_status
                     ))
-                    notifications_created += 1
-            
-            if (i + 1) % 40 == 0:
-                print(f"  ✓ Created {i + 1}/200 incidents...")
-        
+
+            # Insert Notification - matches exact schema
+            cursor.executemany(NOTIFICATION_INSERT, notification_rows)
+        notifications_created = len(notification_rows)
+
         print(f"✅ Created {incidents_created} incidents with {notifications_created} notifications\n")
         
         # 3. Create System Logs (last 30 days)
@@ -259,37 +411,36 @@ def populate_database():
             ]
         }
         
+        log_minutes_ago = rng.integers(0, 30 * 24 * 60, size=500)
+        log_level_draws = random.choices(log_levels, cum_weights=LOG_LEVEL_CUM, k=500)
+        log_source_draws = random.choices(log_sources, k=500)
+        log_ts_strs = fmt_batch(log_minutes_ago, now)
+
+        log_rows = []
         for i in range(500):
-            days_ago = random.randint(0, 30)
-            hours_ago = random.randint(0, 23)
-            minutes_ago = random.randint(0, 59)
-            timestamp = now - timedelta(days=days_ago, hours=hours_ago, minutes=minutes_ago)
-            
-            level = random.choices(log_levels, weights=[70, 20, 10])[0]
-            source = random.choice(log_sources)
+            level = log_level_draws[i]
             message = random.choice(log_messages[level])
-            
-            # Insert SystemLog - matches exact schema
-            cursor.execute("""
-                INSERT INTO SystemLog (
-                    timestamp, level, source, message
-                ) VALUES (?, ?, ?, ?)
-            """, (
-                timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-                level,
-                source,
-                message
-            ))
-            logs_created += 1
-            
-            if (i + 1) % 100 == 0:
-                print(f"  ✓ Created {i + 1}/500 logs...")
-        
+
+            log_rows.append((str(log_ts_strs[i]), level, log_source_draws[i], message))
+
+        # Insert SystemLog - matches exact schema
+        cursor.executemany(SYSTEMLOG_INSERT, log_rows)
+        logs_created = len(log_rows)
+
         print(f"✅ Created {logs_created} system logs\n")
         
+        # Re-enable foreign keys and verify the loaded data in one pass,
+        # BEFORE committing - a violation must roll the whole load back,
+        # not fire after the bad rows are already durable
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA foreign_key_check")
+        violations = cursor.fetchall()
+        if violations:
+            raise RuntimeError(f"Foreign key check failed after bulk load: {violations}")
+
         # Commit all changes
         conn.commit()
-        
+
         # Print summary
         print("=" * 60)
         print("📈 DATABASE POPULATION COMPLETE!")
@@ -316,6 +467,10 @@ def populate_database():
         conn.rollback()
         raise
     finally:
+        # Refresh planner statistics so the first dashboard queries against
+        # the freshly seeded tables pick sensible indexes
+        conn.execute("PRAGMA analysis_limit=400")
+        conn.execute("PRAGMA optimize")
         conn.close()
 
 if __name__ == "__main__":
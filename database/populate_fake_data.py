@@ -3,6 +3,7 @@ Populate Database with Realistic Fake Data for Analytics Dashboard
 Creates accidents, alerts, incidents, notifications, and system logs
 """
 
+import argparse
 import asyncio
 import random
 from datetime import datetime, timedelta
@@ -12,7 +13,7 @@ import sys
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from prisma import Prisma
+from _prisma_session import prisma_session
 from config import Config
 
 # Malaysia cities and locations
@@ -50,41 +51,51 @@ DETECTED_OBJECTS_TEMPLATES = [
 
 RESPONDER_ROLES = ["hospital", "police", "ambulance"]
 
-async def populate_data():
+# How many create() calls to run concurrently per asyncio.gather batch
+CREATE_BATCH_SIZE = 50
+
+
+def chunked(items, size=CREATE_BATCH_SIZE):
+    """Yield successive fixed-size slices of a list"""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+async def populate_data(verbose=True):
     """Populate database with fake data"""
-    db = Prisma()
-    await db.connect()
+    log = print if verbose else (lambda *args, **kwargs: None)
+    async with prisma_session() as db:
     
-    print("🎲 Starting database population with fake data...")
+        log("🎲 Starting database population with fake data...")
     
-    try:
-        # Get current date
-        now = datetime.now()
-        
-        # 1. Create Accidents (last 90 days)
-        print("\n📊 Creating accident records...")
-        accidents_created = 0
+        try:
+            # Get current date
+            now = datetime.now()
         
-        for i in range(150):  # 150 accidents over 90 days
-            days_ago = random.randint(0, 90)
-            hours_ago = random.randint(0, 23)
-            minutes_ago = random.randint(0, 59)
-            
-            timestamp = now - timedelta(days=days_ago, hours=hours_ago, minutes=minutes_ago)
-            location = random.choice(MALAYSIA_LOCATIONS)
-            severity = random.choices(
-                SEVERITIES, 
-                weights=[30, 40, 20, 10]  # More low/medium, fewer critical
-            )[0]
-            
-            confidence = random.uniform(0.65, 0.99)
-            status = random.choices(
-                ["pending", "confirmed", "resolved", "false_alarm"],
-                weights=[10, 30, 50, 10]
-            )[0]
-            
-            accident = await db.accident.create(
-                data={
+            # 1. Create Accidents (last 90 days)
+            log("\n📊 Creating accident records...")
+            accident_payloads = []
+            accident_contexts = []  # (timestamp, location, severity) reused for alerts
+
+            for i in range(150):  # 150 accidents over 90 days
+                days_ago = random.randint(0, 90)
+                hours_ago = random.randint(0, 23)
+                minutes_ago = random.randint(0, 59)
+
+                timestamp = now - timedelta(days=days_ago, hours=hours_ago, minutes=minutes_ago)
+                location = random.choice(MALAYSIA_LOCATIONS)
+                severity = random.choices(
+                    SEVERITIES,
+                    weights=[30, 40, 20, 10]  # More low/medium, fewer critical
+                )[0]
+
+                confidence = random.uniform(0.65, 0.99)
+                status = random.choices(
+                    ["pending", "confirmed", "resolved", "false_alarm"],
+                    weights=[10, 30, 50, 10]
+                )[0]
+
+                accident_payloads.append({
                     "timestamp": timestamp,
                     "location_lat": location["lat"] + random.uniform(-0.01, 0.01),
                     "location_lon": location["lon"] + random.uniform(-0.01, 0.01),
@@ -97,42 +108,53 @@ async def populate_data():
                     "detected_objects": random.choice(DETECTED_OBJECTS_TEMPLATES),
                     "status": status,
                     "notes": f"Auto-detected accident with {confidence:.1%} confidence"
-                }
-            )
-            accidents_created += 1
-            
+                })
+                accident_contexts.append((timestamp, location, severity))
+
+            # Run the creates concurrently in batches so round-trips overlap
+            accidents = []
+            for batch in chunked(accident_payloads):
+                accidents.extend(await asyncio.gather(
+                    *(db.accident.create(data=payload) for payload in batch)
+                ))
+            accidents_created = len(accidents)
+
             # Create alerts for each accident (2-4 alerts)
-            num_alerts = random.randint(2, 4)
-            for j in range(num_alerts):
-                language = random.choice(ALERT_LANGUAGES)
-                await db.alert.create(
-                    data={
+            alert_payloads = []
+            for accident, (timestamp, location, severity) in zip(accidents, accident_contexts):
+                # Message depends only on location and severity - build once per accident
+                message = f"Accident detected at {location['name']}, severity: {severity}"
+                num_alerts = random.randint(2, 4)
+                for j in range(num_alerts):
+                    language = random.choice(ALERT_LANGUAGES)
+                    alert_payloads.append({
                         "accident_id": accident.id,
                         "language": language,
-                        "message": f"Accident detected at {location['name']}, severity: {severity}",
+                        "message": message,
                         "sent_at": timestamp + timedelta(seconds=random.randint(5, 30)),
                         "status": random.choices(["sent", "failed"], weights=[95, 5])[0],
                         "recipient": f"+60{random.randint(100000000, 199999999)}"
-                    }
-                )
-        
-        print(f"✅ Created {accidents_created} accident records")
-        
-        # 2. Create Incidents (last 60 days)
-        print("\n📊 Creating incident records...")
-        incidents_created = 0
+                    })
+
+            for batch in chunked(alert_payloads):
+                await asyncio.gather(*(db.alert.create(data=payload) for payload in batch))
+
+            log(f"✅ Created {accidents_created} accident records")
         
-        for i in range(200):  # 200 incidents over 60 days
-            days_ago = random.randint(0, 60)
-            hours_ago = random.randint(0, 23)
-            
-            timestamp = now - timedelta(days=days_ago, hours=hours_ago)
-            location = random.choice(MALAYSIA_LOCATIONS)
-            severity = random.choices(SEVERITIES, weights=[25, 40, 25, 10])[0]
-            status = random.choices(INCIDENT_STATUS, weights=[15, 25, 60])[0]
-            
-            incident = await db.incident.create(
-                data={
+            # 2. Create Incidents (last 60 days)
+            log("\n📊 Creating incident records...")
+            incident_payloads = []
+
+            for i in range(200):  # 200 incidents over 60 days
+                days_ago = random.randint(0, 60)
+                hours_ago = random.randint(0, 23)
+
+                timestamp = now - timedelta(days=days_ago, hours=hours_ago)
+                location = random.choice(MALAYSIA_LOCATIONS)
+                severity = random.choices(SEVERITIES, weights=[25, 40, 25, 10])[0]
+                status = random.choices(INCIDENT_STATUS, weights=[15, 25, 60])[0]
+
+                incident_payloads.append({
                     "timestamp": timestamp,
                     "location_lat": location["lat"] + random.uniform(-0.01, 0.01),
                     "location_lon": location["lon"] + random.uniform(-0.01, 0.01),
@@ -145,33 +167,38 @@ async def populate_data():
                     "type": random.choice(ACCIDENT_TYPES),
                     "confidence": random.uniform(0.70, 0.98),
                     "description": f"{random.choice(ACCIDENT_TYPES).title()} accident detected"
-                }
-            )
-            incidents_created += 1
-        
-        print(f"✅ Created {incidents_created} incident records")
+                })
+
+            incidents_created = 0
+            for batch in chunked(incident_payloads):
+                created = await asyncio.gather(
+                    *(db.incident.create(data=payload) for payload in batch)
+                )
+                incidents_created += len(created)
+
+            log(f"✅ Created {incidents_created} incident records")
         
-        # 3. Get responders for notifications
-        responders = await db.responder.find_many()
+            # 3. Get responders for notifications
+            responders = await db.responder.find_many()
         
-        if responders:
-            print("\n📊 Creating notifications...")
-            notifications_created = 0
+            if responders:
+                log("\n📊 Creating notifications...")
+                notifications_created = 0
             
-            # Get all incidents
-            all_incidents = await db.incident.find_many(
-                take=150,
-                order={'timestamp': 'desc'}
-            )
+                # Get all incidents
+                all_incidents = await db.incident.find_many(
+                    take=150,
+                    order={'timestamp': 'desc'}
+                )
             
-            for incident in all_incidents:
-                # Create 3-5 notifications per incident
-                num_notifications = random.randint(3, 5)
-                selected_responders = random.sample(responders, min(num_notifications, len(responders)))
-                
-                for responder in selected_responders:
-                    notification = await db.notification.create(
-                        data={
+                notification_payloads = []
+                for incident in all_incidents:
+                    # Create 3-5 notifications per incident
+                    num_notifications = random.randint(3, 5)
+                    selected_responders = random.sample(responders, min(num_notifications, len(responders)))
+
+                    for responder in selected_responders:
+                        notification_payloads.append({
                             "incident_id": incident.id,
                             "responder_id": responder.id,
                             "language": random.choice(ALERT_LANGUAGES),
@@ -180,110 +207,119 @@ async def populate_data():
                             "sent_time": incident.timestamp + timedelta(seconds=random.randint(10, 60)),
                             "delivered_time": incident.timestamp + timedelta(seconds=random.randint(70, 120)),
                             "status": random.choices(["sent", "delivered", "failed"], weights=[10, 85, 5])[0]
-                        }
+                        })
+
+                for batch in chunked(notification_payloads):
+                    created = await asyncio.gather(
+                        *(db.notification.create(data=payload) for payload in batch)
                     )
-                    notifications_created += 1
-            
-            print(f"✅ Created {notifications_created} notification records")
+                    notifications_created += len(created)
+
+                log(f"✅ Created {notifications_created} notification records")
         
-        # 4. Create System Logs (last 30 days)
-        print("\n📊 Creating system log records...")
-        logs_created = 0
+            # 4. Create System Logs (last 30 days)
+            log("\n📊 Creating system log records...")
+            logs_created = 0
         
-        log_sources = ["detection", "translation", "telegram", "api", "system"]
-        log_levels = ["INFO", "WARNING", "ERROR"]
+            log_sources = ["detection", "translation", "telegram", "api", "system"]
+            log_levels = ["INFO", "WARNING", "ERROR"]
         
-        log_messages = {
-            "INFO": [
-                "System started successfully",
-                "Detection model loaded",
-                "Video stream initialized",
-                "Notification sent successfully",
-                "API request processed"
-            ],
-            "WARNING": [
-                "High CPU usage detected",
-                "Low disk space warning",
-                "Slow response time detected",
-                "Network latency increased"
-            ],
-            "ERROR": [
-                "Failed to send notification",
-                "Database connection timeout",
-                "API request failed",
-                "Video stream interrupted"
-            ]
-        }
+            log_messages = {
+                "INFO": [
+                    "System started successfully",
+                    "Detection model loaded",
+                    "Video stream initialized",
+                    "Notification sent successfully",
+                    "API request processed"
+                ],
+                "WARNING": [
+                    "High CPU usage detected",
+                    "Low disk space warning",
+                    "Slow response time detected",
+                    "Network latency increased"
+                ],
+                "ERROR": [
+                    "Failed to send notification",
+                    "Database connection timeout",
+                    "API request failed",
+                    "Video stream interrupted"
+                ]
+            }
         
-        for i in range(500):  # 500 logs over 30 days
-            days_ago = random.randint(0, 30)
-            hours_ago = random.randint(0, 23)
-            timestamp = now - timedelta(days=days_ago, hours=hours_ago)
-            
-            level = random.choices(log_levels, weights=[70, 20, 10])[0]
-            source = random.choice(log_sources)
-            message = random.choice(log_messages[level])
-            
-            await db.systemlog.create(
-                data={
+            log_payloads = []
+            for i in range(500):  # 500 logs over 30 days
+                days_ago = random.randint(0, 30)
+                hours_ago = random.randint(0, 23)
+                timestamp = now - timedelta(days=days_ago, hours=hours_ago)
+
+                level = random.choices(log_levels, weights=[70, 20, 10])[0]
+                source = random.choice(log_sources)
+                message = random.choice(log_messages[level])
+
+                log_payloads.append({
                     "timestamp": timestamp,
                     "level": level,
                     "source": source,
                     "message": message,
                     "details": f'{{"source": "{source}", "timestamp": "{timestamp.isoformat()}"}}'
-                }
-            )
-            logs_created += 1
-        
-        print(f"✅ Created {logs_created} system log records")
+                })
+
+            for batch in chunked(log_payloads):
+                created = await asyncio.gather(
+                    *(db.systemlog.create(data=payload) for payload in batch)
+                )
+                logs_created += len(created)
+
+            log(f"✅ Created {logs_created} system log records")
         
-        # Print summary statistics
-        print("\n" + "="*60)
-        print("📈 DATABASE POPULATION SUMMARY")
-        print("="*60)
+            # Print summary statistics
+            log("\n" + "="*60)
+            log("📈 DATABASE POPULATION SUMMARY")
+            log("="*60)
         
-        total_accidents = await db.accident.count()
-        total_alerts = await db.alert.count()
-        total_incidents = await db.incident.count()
-        total_notifications = await db.notification.count()
-        total_logs = await db.systemlog.count()
+            total_accidents = await db.accident.count()
+            total_alerts = await db.alert.count()
+            total_incidents = await db.incident.count()
+            total_notifications = await db.notification.count()
+            total_logs = await db.systemlog.count()
         
-        print(f"📊 Total Accidents: {total_accidents}")
-        print(f"📨 Total Alerts: {total_alerts}")
-        print(f"🚨 Total Incidents: {total_incidents}")
-        print(f"📢 Total Notifications: {total_notifications}")
-        print(f"📝 Total System Logs: {total_logs}")
+            log(f"📊 Total Accidents: {total_accidents}")
+            log(f"📨 Total Alerts: {total_alerts}")
+            log(f"🚨 Total Incidents: {total_incidents}")
+            log(f"📢 Total Notifications: {total_notifications}")
+            log(f"📝 Total System Logs: {total_logs}")
         
-        # Show breakdown by severity
-        print("\n🔴 Severity Distribution:")
-        for severity in SEVERITIES:
-            count = await db.accident.count(where={"severity": severity})
-            print(f"   {severity.upper()}: {count}")
+            # Show breakdown by severity
+            log("\n🔴 Severity Distribution:")
+            for severity in SEVERITIES:
+                count = await db.accident.count(where={"severity": severity})
+                log(f"   {severity.upper()}: {count}")
         
-        # Show breakdown by status
-        print("\n✅ Status Distribution:")
-        for status in ["pending", "confirmed", "resolved", "false_alarm"]:
-            count = await db.accident.count(where={"status": status})
-            print(f"   {status.upper()}: {count}")
+            # Show breakdown by status
+            log("\n✅ Status Distribution:")
+            for status in ["pending", "confirmed", "resolved", "false_alarm"]:
+                count = await db.accident.count(where={"status": status})
+                log(f"   {status.upper()}: {count}")
         
-        # Show recent activity
-        print("\n📅 Recent Activity (Last 7 Days):")
-        week_ago = now - timedelta(days=7)
-        recent_accidents = await db.accident.count(
-            where={"timestamp": {"gte": week_ago}}
-        )
-        print(f"   Accidents: {recent_accidents}")
+            # Show recent activity
+            log("\n📅 Recent Activity (Last 7 Days):")
+            week_ago = now - timedelta(days=7)
+            recent_accidents = await db.accident.count(
+                where={"timestamp": {"gte": week_ago}}
+            )
+            log(f"   Accidents: {recent_accidents}")
         
-        print("\n✨ Database population completed successfully!")
-        print("="*60)
+            log("\n✨ Database population completed successfully!")
+            log("="*60)
         
-    except Exception as e:
-        print(f"\n❌ Error populating database: {e}")
-        import traceback
-        traceback.print_exc()
+        except Exception as e:
+            print(f"\n❌ Error populating database: {e}")
+            import traceback
+            traceback.print_exc()
     
-    finally:
-        await db.disconnect()
 
 if __name__ == "__main__":
-    asyncio.run(populate_data())
+    parser = argparse.ArgumentParser(description="Populate the database with fake analytics data")
+    parser.add_argument('--quiet', action='store_true', help='suppress progress output')
+    args = parser.parse_args()
+    asyncio.run(populate_data(verbose=not args.quiet))
@@ -0,0 +1,64 @@
+"""
+One-shot database seeding fixture
+
+Runs the individual seeding/maintenance scripts as stages of a single
+process so the setup flow is one command instead of four:
+
+    python database/seed.py --stage all
+
+Stages:
+    populate   - populate_fake_data_simple (accidents, alerts, incidents,
+                 notifications, system logs)
+    locations  - update_accident_locations (city assignment by coordinates)
+    users      - update_user_locations + update_researchers_policy_makers
+
+Running them in one interpreter means Python/Prisma start-up is paid once:
+both user stages share the cached engine from _prisma_session, and the
+populate stage keeps its in-memory staging (already a single transaction
+flushed with one backup), so no per-script cold starts or extra WAL
+checkpoints remain.
+"""
+
+import argparse
+import asyncio
+
+from _prisma_session import prisma_session
+from populate_fake_data_simple import populate_database
+from update_accident_locations import update_accident_locations
+from update_user_locations import update_user_locations
+from update_researchers_policy_makers import update_users_all_locations
+
+STAGES = ["populate", "locations", "users", "all"]
+
+
+async def _run_user_stages():
+    """Both user updates on one Prisma engine connection"""
+    # The outer session holds the connection open across both stages;
+    # their inner sessions nest instead of reconnecting
+    async with prisma_session():
+        await update_user_locations()
+        await update_users_all_locations()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed the RoadSafeNet database")
+    parser.add_argument(
+        "--stage", choices=STAGES, default="all",
+        help="which seeding stage to run (default: all)"
+    )
+    args = parser.parse_args()
+
+    if args.stage in ("populate", "all"):
+        populate_database()
+
+    if args.stage in ("locations", "all"):
+        update_accident_locations()
+
+    if args.stage in ("users", "all"):
+        asyncio.run(_run_user_stages())
+
+    print("✨ Seeding complete!")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,22 @@ This script adds city data to existing accidents for location-based filtering
 """
 
 import sqlite3
-import random
 import os
 
 def update_accident_locations():
     """Update accidents with city data based on their coordinates"""
     
-    db_path = os.path.join(os.path.dirname(__file__), 'roadsafenet.db')
+    db_path = os.path.join(os.path.dirname(__file__), 'database', 'roadsafenet.db')
     conn = sqlite3.connect(db_path)
+
+    # Write-heavy workload: WAL + relaxed sync + in-memory temp/cache make
+    # the load memory-bound instead of fsync-bound
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")    # 64 MB page cache
+    conn.execute("PRAGMA mmap_size=268435456")  # 256 MB mmap
+    conn.execute("PRAGMA busy_timeout=5000")
     cursor = conn.cursor()
     
     # City boundaries (approximate)
@@ -24,37 +32,48 @@ def update_accident_locations():
         'Kuching': {'lat_min': 1.4, 'lat_max': 1.6, 'lon_min': 110.2, 'lon_max': 110.5},
     }
     
-    # Get all accidents
-    cursor.execute('SELECT id, location_lat, location_lon FROM Accident')
-    accidents = cursor.fetchall()
-    print(f"\nFound {len(accidents)} accidents in database")
-    
-    updated_count = 0
+    cursor.execute('SELECT COUNT(*) FROM Accident')
+    updated_count = cursor.fetchone()[0]
+    print(f"\nFound {updated_count} accidents in database")
+
     cities = list(city_boundaries.keys())
-    
-    for accident_id, lat, lon in accidents:
-        # Try to match city by coordinates
-        matched_city = None
-        for city, bounds in city_boundaries.items():
-            if (bounds['lat_min'] <= lat <= bounds['lat_max'] and 
-                bounds['lon_min'] <= lon <= bounds['lon_max']):
-                matched_city = city
-                break
-        
-        # If no match, assign random city for testing purposes
-        if not matched_city:
-            matched_city = random.choice(cities)
-        
-        # Update accident with city
-        cursor.execute(
-            'UPDATE Accident SET city = ?, country = ? WHERE id = ?',
-            (matched_city, 'Malaysia', accident_id)
+
+    # Match cities by coordinates, falling back to a random city (for
+    # testing purposes) when no boundary matches - one set-based UPDATE
+    # where both the point-in-box test and the random pick run inside the
+    # SQLite VM, with no per-row Python round trips
+    clauses = []
+    params = list(cities)
+    for city, bounds in city_boundaries.items():
+        clauses.append(
+            'WHEN location_lat BETWEEN ? AND ? AND location_lon BETWEEN ? AND ? THEN ?'
         )
-        
-        updated_count += 1
-        print(f"✅ Accident #{accident_id} -> {matched_city}")
-    
+        params.extend([
+            bounds['lat_min'], bounds['lat_max'],
+            bounds['lon_min'], bounds['lon_max'],
+            city
+        ])
+    city_values = ', '.join(['(?)'] * len(cities))
+    # The fallback subquery must reference an outer column (Accident.id):
+    # an uncorrelated scalar subquery is evaluated once per statement,
+    # which would hand every unmatched row the same "random" city.
+    # ORDER BY random() LIMIT 1 then draws an independent uniform pick on
+    # each per-row evaluation.
+    cursor.execute(
+        f'WITH cities(name) AS (VALUES {city_values}) '
+        "UPDATE Accident SET country = 'Malaysia', city = COALESCE(CASE "
+        + ' '.join(clauses)
+        + ' ELSE NULL END, '
+        '(SELECT name FROM cities WHERE Accident.id >= 0 ORDER BY random() LIMIT 1))',
+        params
+    )
+
     conn.commit()
+
+    # Refresh planner statistics after the bulk update so later city-based
+    # filters plan against current data
+    conn.execute("PRAGMA analysis_limit=400")
+    conn.execute("PRAGMA optimize")
     conn.close()
     print(f"\n✨ Updated {updated_count} accidents with city information!")
     print("Incidents will now be filtered by user's city\n")
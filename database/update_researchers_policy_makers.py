@@ -2,42 +2,37 @@
 Update researchers and policy_makers to see all locations
 """
 
+import argparse
 import asyncio
 import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from prisma import Prisma
+from _prisma_session import prisma_session
 
-async def update_users_all_locations():
+async def update_users_all_locations(verbose=True):
     """Update specific users to see all locations"""
-    db = Prisma()
-    await db.connect()
-    
-    # Users that should see all locations
-    users_to_update = ['researchers', 'policy_makers']
-    
-    for username in users_to_update:
-        user = await db.user.find_first(where={'username': username})
-        if user:
-            await db.user.update(
-                where={'id': user.id},
-                data={
-                    'city': None,
-                    'state': None,
-                    'country': None,
-                    'latitude': None,
-                    'longitude': None
-                }
-            )
-            print(f"✅ Updated {username} to see all locations")
-        else:
-            print(f"⚠️ User {username} not found")
-    
-    await db.disconnect()
-    print("\n✨ Update complete!")
-    print("Researchers and policy_makers can now see all incidents from all cities\n")
+    log = print if verbose else (lambda *args, **kwargs: None)
+    async with prisma_session() as db:
+        # Users that should see all locations
+        users_to_update = ['researchers', 'policy_makers']
+
+        # One raw UPDATE replaces the per-user find_first + update round trips
+        updated = await db.execute_raw(
+            'UPDATE "User" SET city = NULL, state = NULL, country = NULL, '
+            'latitude = NULL, longitude = NULL WHERE username IN (?, ?)',
+            *users_to_update
+        )
+        log(f"✅ Updated {updated}/{len(users_to_update)} users to see all locations")
+        if updated < len(users_to_update):
+            log("⚠️ Some users were not found")
+
+    log("\n✨ Update complete!")
+    log("Researchers and policy_makers can now see all incidents from all cities\n")
 
 if __name__ == "__main__":
-    asyncio.run(update_users_all_locations())
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--quiet', action='store_true', help='suppress progress output')
+    args = parser.parse_args()
+    asyncio.run(update_users_all_locations(verbose=not args.quiet))
@@ -3,63 +3,75 @@ Update user locations for location-based filtering
 This script adds city and coordinates to existing users
 """
 
+import argparse
 import asyncio
 import sys
 from pathlib import Path
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-from prisma import Prisma
+from _prisma_session import prisma_session
 
-async def update_user_locations():
+async def update_user_locations(verbose=True):
     """Update users with city and location data"""
-    db = Prisma()
-    await db.connect()
-    
-    # Define city locations in Malaysia
-    city_data = {
-        'Kuala Lumpur': {'lat': 3.1390, 'lon': 101.6869, 'state': 'Federal Territory', 'country': 'Malaysia'},
-        'Penang': {'lat': 5.4164, 'lon': 100.3327, 'state': 'Penang', 'country': 'Malaysia'},
-        'Johor Bahru': {'lat': 1.4927, 'lon': 103.7414, 'state': 'Johor', 'country': 'Malaysia'},
-        'Ipoh': {'lat': 4.5975, 'lon': 101.0901, 'state': 'Perak', 'country': 'Malaysia'},
-        'Melaka': {'lat': 2.1896, 'lon': 102.2501, 'state': 'Melaka', 'country': 'Malaysia'},
-        'Kuching': {'lat': 1.5535, 'lon': 110.3593, 'state': 'Sarawak', 'country': 'Malaysia'},
-    }
-    
-    # Get all users
-    users = await db.user.find_many()
-    print(f"\nFound {len(users)} users in database")
-    
-    # Assign cities to users (round-robin for variety)
-    cities = list(city_data.keys())
-    
-    for i, user in enumerate(users):
-        # Skip admin (keep them with all locations access)
-        if user.role == 'admin':
-            print(f"Skipping {user.username} (admin) - will see all locations")
-            continue
-        
-        # Assign city to operators and viewers
-        city = cities[i % len(cities)]
-        location = city_data[city]
-        
-        await db.user.update(
-            where={'id': user.id},
-            data={
-                'city': city,
-                'state': location['state'],
-                'country': location['country'],
-                'latitude': location['lat'],
-                'longitude': location['lon']
-            }
-        )
-        
-        print(f"✅ Updated {user.username} ({user.role}) -> {city} ({location['lat']}, {location['lon']})")
-    
-    await db.disconnect()
-    print("\n✨ User locations updated successfully!")
-    print("Users will now see incidents filtered by their city")
-    print("Admins will continue to see all incidents\n")
+    log = print if verbose else (lambda *args, **kwargs: None)
+    async with prisma_session() as db:
+        # Define city locations in Malaysia
+        city_data = {
+            'Kuala Lumpur': {'lat': 3.1390, 'lon': 101.6869, 'state': 'Federal Territory', 'country': 'Malaysia'},
+            'Penang': {'lat': 5.4164, 'lon': 100.3327, 'state': 'Penang', 'country': 'Malaysia'},
+            'Johor Bahru': {'lat': 1.4927, 'lon': 103.7414, 'state': 'Johor', 'country': 'Malaysia'},
+            'Ipoh': {'lat': 4.5975, 'lon': 101.0901, 'state': 'Perak', 'country': 'Malaysia'},
+            'Melaka': {'lat': 2.1896, 'lon': 102.2501, 'state': 'Melaka', 'country': 'Malaysia'},
+            'Kuching': {'lat': 1.5535, 'lon': 110.3593, 'state': 'Sarawak', 'country': 'Malaysia'},
+        }
+
+        # Get all users
+        users = await db.user.find_many()
+        log(f"\nFound {len(users)} users in database")
+
+        # Assign cities to users (round-robin for variety)
+        cities = list(city_data.keys())
+
+        assignments = []
+        for i, user in enumerate(users):
+            # Skip admin (keep them with all locations access)
+            if user.role == 'admin':
+                log(f"Skipping {user.username} (admin) - will see all locations")
+                continue
+
+            # Assign city to operators and viewers
+            city = cities[i % len(cities)]
+            assignments.append((user, city, city_data[city]))
+
+        if assignments:
+            # One raw UPDATE ... FROM (VALUES ...) join replaces a Prisma engine
+            # round-trip per user (SQLite names VALUES columns column1..columnN)
+            params = []
+            for user, city, location in assignments:
+                params.extend([
+                    user.id, city, location['state'], location['country'],
+                    location['lat'], location['lon']
+                ])
+            rows_sql = ', '.join(['(?, ?, ?, ?, ?, ?)'] * len(assignments))
+            await db.execute_raw(
+                'UPDATE "User" SET '
+                'city = v.column2, state = v.column3, country = v.column4, '
+                'latitude = v.column5, longitude = v.column6 '
+                f'FROM (VALUES {rows_sql}) AS v '
+                'WHERE "User".id = v.column1',
+                *params
+            )
+
+        for user, city, location in assignments:
+            log(f"✅ Updated {user.username} ({user.role}) -> {city} ({location['lat']}, {location['lon']})")
+
+    log("\n✨ User locations updated successfully!")
+    log("Users will now see incidents filtered by their city")
+    log("Admins will continue to see all incidents\n")
 
 if __name__ == "__main__":
-    asyncio.run(update_user_locations())
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--quiet', action='store_true', help='suppress progress output')
+    args = parser.parse_args()
+    asyncio.run(update_user_locations(verbose=not args.quiet))
@@ -189,7 +189,7 @@ class VideoStream:
                 conn = sqlite3.connect(db_path)
                 cursor = conn.cursor()
                 
-                severity = 'HIGH' if confidence > 0.8 else 'MEDIUM'
+                severity = 'high' if confidence > 0.8 else 'medium'
                 
                 cursor.execute('''
                     INSERT INTO Accident (
@@ -203,7 +203,7 @@ class VideoStream:
                     'Kuala Lumpur',
                     'Malaysia',
                     severity,
-                    'ACTIVE',
+                    'active',
                     lat,
                     lon,
                     confidence,
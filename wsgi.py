@@ -0,0 +1,12 @@
+"""
+WSGI entry point for the web dashboard
+
+Run in production with gunicorn instead of the Flask dev server so
+requests aren't serialized through one interpreter thread:
+
+    gunicorn -k gevent -w 9 -b 0.0.0.0:8050 wsgi:application
+
+Worker count rule of thumb: 2 * CPU cores + 1.
+"""
+
+from frontend.app import server as application